@@ -8,7 +8,7 @@ from cortexagent.tools import ToolContext
 from cortexagent.tools.registry import ToolRegistry
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutedStep:
     id: str
     action: str
@@ -109,6 +109,7 @@ class AgentOrchestrator:
             authorization=authorization,
         )
 
+        step_payloads = [self._step_payload(step) for step in executed]
         decision = AgentDecision(
             action="orchestration" if len(executed) > 1 else executed[0].action,
             reason=planner_result.reason,
@@ -119,7 +120,7 @@ class AgentOrchestrator:
             response=assistant_text,
             decision=decision,
             sources=self._collect_sources(executed),
-            tool_pipeline=[self._step_payload(step) for step in executed],
+            tool_pipeline=step_payloads,
         )
         return AgentRuntimeResult(
             response=response,
@@ -128,7 +129,7 @@ class AgentOrchestrator:
                 "planner_reason": planner_result.reason,
                 "planner_confidence": planner_result.confidence,
                 "planner_raw": planner_result.planner_raw,
-                "executed_steps": [self._step_payload(step) for step in executed],
+                "executed_steps": step_payloads,
             },
         )
 
@@ -142,8 +143,13 @@ class AgentOrchestrator:
 
     @staticmethod
     def _fallback_tool_summary(executed_steps: list[ExecutedStep]) -> str:
-        successful = [step for step in executed_steps if step.success]
-        failed = [step for step in executed_steps if not step.success]
+        successful: list[ExecutedStep] = []
+        failed: list[ExecutedStep] = []
+        for step in executed_steps:
+            if step.success:
+                successful.append(step)
+            else:
+                failed.append(step)
         if not successful:
             lines = ["I couldn't complete the requested tool actions."]
             for step in failed[:3]:
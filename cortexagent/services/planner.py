@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from .llm_client import OpenAICompatibleClient, extract_first_json_object
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlannedStep:
     id: str
     tool: str
@@ -126,6 +127,7 @@ class LlmPlanner:
         )
 
     @staticmethod
+    @lru_cache(maxsize=8)
     def _build_system_prompt(tool_registry_prompt: str) -> str:
         return (
             "You are the Cortex Planner. Decide intent semantically from full context.\n"
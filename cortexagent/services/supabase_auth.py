@@ -13,7 +13,7 @@ def extract_bearer_token(authorization: str | None) -> str | None:
     raw = authorization.strip()
     if not raw:
         return None
-    if not raw.lower().startswith("bearer "):
+    if raw[:7].lower() != "bearer ":
         return None
     token = raw[7:].strip()
     return token or None
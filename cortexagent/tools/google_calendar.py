@@ -21,11 +21,12 @@ class GoogleCalendarTool(Tool):
             raise RuntimeError("Google account is not connected. Please connect Google first.")
 
         operation = str(tool_meta.get("operation") or "read").strip().lower()
-        args = tool_meta.get("args") if isinstance(tool_meta.get("args"), dict) else {}
+        raw_args = tool_meta.get("args")
+        args = raw_args if isinstance(raw_args, dict) else {}
         max_results = self._coerce_max_results(tool_meta.get("max_results"), default=8)
 
         if operation in {"create", "write"}:
-            event_text = str((args or {}).get("event_text") or context.user_text or "").strip()
+            event_text = str(args.get("event_text") or context.user_text or "").strip()
             if not event_text:
                 raise RuntimeError("Missing event_text for calendar create operation.")
             created = self._quick_add_event(access_token=access_token, event_text=event_text)
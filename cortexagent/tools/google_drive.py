@@ -8,6 +8,14 @@ from urllib import request as urlrequest
 from .base import Tool, ToolContext, ToolResult, ToolResultItem
 
 
+_GOOGLE_APPS_TYPE_LABELS = {
+    "application/vnd.google-apps.document": "Google Doc",
+    "application/vnd.google-apps.spreadsheet": "Google Sheet",
+    "application/vnd.google-apps.presentation": "Google Slides",
+    "application/vnd.google-apps.folder": "Folder",
+}
+
+
 class GoogleDriveTool(Tool):
     name = "google_drive"
     DRIVE_FILES_URL = "https://www.googleapis.com/drive/v3/files"
@@ -18,11 +26,11 @@ class GoogleDriveTool(Tool):
         if not isinstance(access_token, str) or not access_token.strip():
             raise RuntimeError("Google account is not connected. Please connect Google first.")
 
-        tool_meta = context.tool_meta if isinstance(context.tool_meta, dict) else {}
-        args = tool_meta.get("args") if isinstance(tool_meta.get("args"), dict) else {}
+        raw_args = tool_meta.get("args")
+        args = raw_args if isinstance(raw_args, dict) else {}
         user_text = (context.user_text or "").strip()
         max_results = 8
-        query = str((args or {}).get("query") or "").strip() or None
+        query = str(args.get("query") or "").strip() or None
         items = self._list_files(
             access_token=access_token.strip(),
             max_results=max_results,
@@ -104,14 +112,9 @@ class GoogleDriveTool(Tool):
 
 def _friendly_type(mime_type: str) -> str:
     lowered = (mime_type or "").lower()
-    if lowered == "application/vnd.google-apps.document":
-        return "Google Doc"
-    if lowered == "application/vnd.google-apps.spreadsheet":
-        return "Google Sheet"
-    if lowered == "application/vnd.google-apps.presentation":
-        return "Google Slides"
-    if lowered == "application/vnd.google-apps.folder":
-        return "Folder"
+    friendly = _GOOGLE_APPS_TYPE_LABELS.get(lowered)
+    if friendly:
+        return friendly
     if lowered.startswith("application/vnd.google-apps"):
         return "Google File"
     if lowered:
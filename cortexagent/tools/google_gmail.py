@@ -28,12 +28,13 @@ class GoogleGmailTool(Tool):
             )
 
         operation = str(tool_meta.get("operation") or "read").strip().lower()
-        args = tool_meta.get("args") if isinstance(tool_meta.get("args"), dict) else {}
+        raw_args = tool_meta.get("args")
+        args = raw_args if isinstance(raw_args, dict) else {}
         max_results = self._coerce_max_results(tool_meta.get("max_results"), default=5)
-        query = str((args or {}).get("query") or "").strip()
+        query = str(args.get("query") or "").strip()
 
         if operation == "send":
-            draft_id = str((args or {}).get("draft_id") or "").strip()
+            draft_id = str(args.get("draft_id") or "").strip()
             if not draft_id:
                 raise RuntimeError("Missing draft_id for Gmail send operation.")
             sent = self._send_draft(access_token=access_token, draft_id=draft_id)
@@ -42,9 +43,9 @@ class GoogleGmailTool(Tool):
             )
 
         if operation == "draft_new":
-            to_addr = str((args or {}).get("to") or "").strip()
-            subject = str((args or {}).get("subject") or "").strip()
-            body = str((args or {}).get("body") or "").strip()
+            to_addr = str(args.get("to") or "").strip()
+            subject = str(args.get("subject") or "").strip()
+            body = str(args.get("body") or "").strip()
             if not to_addr or not body:
                 raise RuntimeError("Missing required args for draft_new: to, body.")
             drafted = self._draft_new_email(
@@ -58,8 +59,8 @@ class GoogleGmailTool(Tool):
             )
 
         if operation == "draft_reply":
-            thread_id = str((args or {}).get("thread_id") or "").strip()
-            body = str((args or {}).get("body") or "").strip()
+            thread_id = str(args.get("thread_id") or "").strip()
+            body = str(args.get("body") or "").strip()
             if not thread_id or not body:
                 raise RuntimeError(
                     "Missing required args for draft_reply: thread_id, body."
@@ -74,7 +75,7 @@ class GoogleGmailTool(Tool):
             )
 
         if operation in {"read_message", "read_thread"}:
-            thread_id = str((args or {}).get("thread_id") or "").strip()
+            thread_id = str(args.get("thread_id") or "").strip()
             if not thread_id:
                 raise RuntimeError("Missing thread_id for read_message operation.")
             details = self._get_thread_details(
@@ -350,7 +351,7 @@ def _extract_email_address(value: str) -> str:
 
 def _reply_subject(subject: str) -> str:
     cleaned = subject.strip()
-    if cleaned.lower().startswith("re:"):
+    if cleaned[:3].lower() == "re:":
         return cleaned
     if not cleaned:
         return "Re: (no subject)"
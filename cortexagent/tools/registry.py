@@ -64,6 +64,7 @@ class ToolDefinition:
 class ToolRegistry:
     def __init__(self) -> None:
         self._tools: dict[str, ToolDefinition] = {}
+        self._rendered_prompt: str | None = None
 
     def register(
         self,
@@ -80,6 +81,7 @@ class ToolRegistry:
             tool=tool,
             schema=schema,
         )
+        self._rendered_prompt = None
 
     def get_definition(self, name: str) -> ToolDefinition:
         try:
@@ -91,6 +93,12 @@ class ToolRegistry:
         return sorted(self._tools.keys())
 
     def render_for_prompt(self) -> str:
+        # Rendered once per registry state; chat requests reuse the cached text.
+        if self._rendered_prompt is None:
+            self._rendered_prompt = self._render_prompt()
+        return self._rendered_prompt
+
+    def _render_prompt(self) -> str:
         lines = ["TOOL REGISTRY"]
         for name in self.list_tools():
             tool = self._tools[name]